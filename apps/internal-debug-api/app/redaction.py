@@ -52,6 +52,9 @@ REDACTION_PATTERNS = {
     # This is handled separately to preserve partial information
 }
 
+# IPv4 addresses - last octet is masked by redact_string()
+IP_ADDRESS_PATTERN = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3})\.(\d{1,3})\b")
+
 # Keys that should have their values redacted entirely
 SENSITIVE_KEYS = {
     "password",
@@ -74,6 +77,11 @@ SENSITIVE_KEYS = {
     "webhook_secret",
 }
 
+# Single alternation over SENSITIVE_KEYS so each key is scanned once
+SENSITIVE_KEY_PATTERN = re.compile(
+    "|".join(re.escape(key) for key in sorted(SENSITIVE_KEYS, key=len, reverse=True))
+)
+
 
 def mask_ip_address(ip: str) -> str:
     """Mask the last octet of an IP address for privacy."""
@@ -105,8 +113,7 @@ def redact_string(value: str, mask_ips: bool = True) -> str:
 
     # Mask IP addresses (preserve structure but hide last octet)
     if mask_ips:
-        ip_pattern = re.compile(r"\b(\d{1,3}\.\d{1,3}\.\d{1,3})\.(\d{1,3})\b")
-        result = ip_pattern.sub(r"\1.xxx", result)
+        result = IP_ADDRESS_PATTERN.sub(r"\1.xxx", result)
 
     return result
 
@@ -116,7 +123,7 @@ def is_sensitive_key(key: str) -> bool:
     if not isinstance(key, str):
         return False
     key_lower = key.lower().replace("-", "_")
-    return any(sensitive in key_lower for sensitive in SENSITIVE_KEYS)
+    return SENSITIVE_KEY_PATTERN.search(key_lower) is not None
 
 
 def redact_value(value: Any, mask_ips: bool = True) -> Any:
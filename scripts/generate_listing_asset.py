@@ -67,6 +67,12 @@ class ListingAssetGenerator:
         self.debug = debug
         self.detector = card_detection.CardDetector(debug=debug)
 
+        # CLAHE settings are fixed per generator, so build the operator once
+        self.clahe = cv2.createCLAHE(
+            clipLimit=clahe_clip,
+            tileGridSize=(clahe_tiles, clahe_tiles)
+        )
+
     def generate(self, input_path: str, output_path: str) -> bool:
         """
         Generate listing asset from processed image.
@@ -200,12 +206,8 @@ class ListingAssetGenerator:
 
         # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization) to L channel
         # This provides mild contrast enhancement without over-amplifying noise
-        # Uses operator-tunable clipLimit and tileGridSize
-        clahe = cv2.createCLAHE(
-            clipLimit=self.clahe_clip,
-            tileGridSize=(self.clahe_tiles, self.clahe_tiles)
-        )
-        l_enhanced = clahe.apply(l_channel)
+        # Uses operator-tunable clipLimit and tileGridSize (see __init__)
+        l_enhanced = self.clahe.apply(l_channel)
 
         if self.debug:
             print(f"  CLAHE: clipLimit={self.clahe_clip}, tiles={self.clahe_tiles}x{self.clahe_tiles}")
@@ -238,11 +240,10 @@ class ListingAssetGenerator:
         if self.debug:
             print(f"  Auto white balance: R={r_factor:.3f}, G={g_factor:.3f}, B={b_factor:.3f}")
 
-        # Apply white balance (clamped to avoid overflow)
-        balanced = enhanced.copy().astype(np.float32)
-        balanced[:, :, 0] = np.clip(balanced[:, :, 0] * b_factor, 0, 255)
-        balanced[:, :, 1] = np.clip(balanced[:, :, 1] * g_factor, 0, 255)
-        balanced[:, :, 2] = np.clip(balanced[:, :, 2] * r_factor, 0, 255)
+        # Apply white balance in place on one float buffer (clamped to avoid overflow)
+        balanced = enhanced.astype(np.float32)
+        balanced *= np.array([b_factor, g_factor, r_factor], dtype=np.float32)
+        np.clip(balanced, 0, 255, out=balanced)
 
         return balanced.astype(np.uint8)
 
@@ -35,6 +35,7 @@ from typing import Any, Dict, List, Optional
 
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
 
 # Shared prompts from Phase 4D baseline
 SYSTEM_PROMPT = (
@@ -66,6 +67,19 @@ OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5-mini-2025-08-07")
 OPENAI_IMAGE_DETAIL = os.getenv("OPENAI_IMAGE_DETAIL", "high")
 
+# Shared across workers so requests reuse keep-alive TLS connections
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session(pool_size: int = 10) -> requests.Session:
+    """Return the shared HTTP session, creating it with a pool of pool_size connections."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        _http_session = session
+    return _http_session
+
 
 class CheckpointManager:
     """Manages checkpoint file for resume support."""
@@ -266,7 +280,7 @@ def run_openai_inference(
     for attempt in range(max_retries):
         try:
             start_time = time.perf_counter()
-            response = requests.post(OPENAI_API_URL, json=payload, headers=headers, timeout=60)
+            response = get_http_session().post(OPENAI_API_URL, json=payload, headers=headers, timeout=60)
             infer_ms = (time.perf_counter() - start_time) * 1000
 
             # Handle rate limiting
@@ -661,7 +675,8 @@ def main():
 
     signal.signal(signal.SIGINT, signal_handler)
 
-    # Process with concurrency
+    # Process with concurrency (size the connection pool to the worker count)
+    get_http_session(args.concurrency)
     start_time = time.time()
 
     try: